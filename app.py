@@ -1,13 +1,33 @@
-from flask import Flask, Request, Response, jsonify, request
+from flask import Flask, Request, Response, request
+import orjson
+import os
 import uuid
 from points_calculator import calculate_points
+from storage import ReceiptStore
 from validators import validate_receipt
-from typing import Dict
 
 app = Flask(__name__)
 
-# In-memory storage for receipts
-receipts: Dict[str, dict] = {}
+# In-memory storage mapping receipt id to its precomputed point total.
+# Points are calculated once at POST time; the receipt dict itself is not
+# retained, so GETs are a single lookup and memory stays ~constant per id.
+# See storage.ReceiptStore for the sharding, locking, and eviction scheme.
+MAX_RECEIPTS = 100_000
+_store = ReceiptStore(max_receipts=MAX_RECEIPTS)
+
+
+# The GET path's response shapes are fixed, so the bodies are assembled
+# as raw bytes rather than going through a JSON encoder per request.
+_NOT_FOUND_BODY = b'{"error":"Receipt not found"}'
+
+
+def _json_response(payload: dict, status: int) -> Response:
+    """Build a JSON response with orjson instead of Flask's jsonify.
+
+    orjson serializes straight to bytes in C, skipping the stdlib json
+    encoder and the extra str -> bytes encode on every response.
+    """
+    return Response(orjson.dumps(payload), status=status, mimetype="application/json")
 
 
 @app.route("/receipts/process", methods=["POST"])
@@ -15,7 +35,8 @@ def process_receipt() -> Response:
     """Process a receipt and return a unique ID.
 
     Accepts a JSON receipt in the request body and validates its format.
-    If valid, stores the receipt and returns a unique identifier.
+    If valid, calculates and stores its point total and returns a unique
+    identifier.
 
     Request Body Format:
     {
@@ -50,25 +71,26 @@ def process_receipt() -> Response:
         ...     ],
         ...     "total": "6.49"
         ... }
-        >>> # Response: {"id": "a7e8f9b1-c2d3-4e5f-6g7h-8i9j0k1l2m3n"}
+        >>> # Response: {"id": "a7e8f9b1c2d34e5f8a7b8c9d0e1f2a3b"}
     """
     try:
-        receipt = request.get_json()
+        receipt = orjson.loads(request.get_data())
         validate_receipt(receipt)
-        receipt_id = str(uuid.uuid4())
-        receipts[receipt_id] = receipt
-        return jsonify({"id": receipt_id}), 200
+        receipt_id = uuid.uuid4().hex
+        _store.store(receipt_id, calculate_points(receipt))
+        return _json_response({"id": receipt_id}, 200)
     except ValueError as e:
-        return jsonify({"error": str(e)}), 400
+        return _json_response({"error": str(e)}, 400)
     except Exception as e:
-        return jsonify({"error": "Internal server error"}), 500
+        return _json_response({"error": "Internal server error"}, 500)
 
 
 @app.route("/receipts/<id>/points", methods=["GET"])
 def get_points(id: str) -> Response:
     """Calculate and return points for a processed receipt.
 
-    Retrieves a receipt by ID and calculates its points based on the rules:
+    Looks up the point total precomputed when the receipt was processed.
+    Points are awarded based on the rules:
     1. One point for every alphanumeric character in the retailer name
     2. 50 points if the total is a round dollar amount with no cents
     3. 25 points if the total is a multiple of 0.25
@@ -87,15 +109,25 @@ def get_points(id: str) -> Response:
 
     Example:
         >>> # Valid request
-        >>> GET /receipts/a7e8f9b1-c2d3-4e5f-6g7h-8i9j0k1l2m3n/points
+        >>> GET /receipts/a7e8f9b1c2d34e5f8a7b8c9d0e1f2a3b/points
         >>> # Response: {"points": 32}
     """
-    if id not in receipts:
-        return jsonify({"error": "Receipt not found"}), 404
+    points = _store.lookup(id)
+    if points is None:
+        return Response(_NOT_FOUND_BODY, status=404, mimetype="application/json")
 
-    points = calculate_points(receipts[id])
-    return jsonify({"points": points}), 200
+    return Response(
+        b'{"points":%d}' % points, status=200, mimetype="application/json"
+    )
 
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=8080)
+    # Werkzeug's dev server is single-threaded; production runs use
+    # gunicorn (see gunicorn_conf.py). Set DEV=1 to run this directly.
+    if os.environ.get("DEV"):
+        app.run(host="0.0.0.0", port=8080)
+    else:
+        raise SystemExit(
+            "Use 'gunicorn -c gunicorn_conf.py app:app' in production, "
+            "or set DEV=1 to run the development server."
+        )
@@ -0,0 +1,19 @@
+"""Gunicorn configuration for the receipt processor service.
+
+Run with: gunicorn -c gunicorn_conf.py app:app
+
+Gevent green-thread workers let concurrent requests overlap instead of
+serializing through Werkzeug's single-threaded development server. Set
+GEVENT_MONITOR_THREAD_ENABLE=1 during development to catch accidentally
+introduced blocking calls.
+"""
+
+bind = "0.0.0.0:8080"
+# Receipt storage lives in-process (see storage.ReceiptStore), so multiple
+# workers would each see only their own receipts and most GETs would 404.
+# Keep one worker — gevent still multiplexes worker_connections concurrent
+# requests within it — until the store is backed by something shared
+# across processes (e.g. Redis behind the store/lookup seam).
+workers = 1
+worker_class = "gevent"
+worker_connections = 1000
@@ -1,6 +1,11 @@
-from datetime import datetime
 from typing import Dict, List, Union
 
+# Translation table that deletes every non-alphanumeric ASCII character,
+# so Rule 1 reduces to len() after a single C-level translate pass.
+_STRIP_NON_ALNUM = str.maketrans(
+    "", "", "".join(chr(i) for i in range(128) if not chr(i).isalnum())
+)
+
 
 def _get_retailer_name_points(retailer: str) -> int:
     """Calculate points based on alphanumeric characters in retailer name (Rule 1).
@@ -14,6 +19,8 @@ def _get_retailer_name_points(retailer: str) -> int:
     Returns:
         Number of alphanumeric characters in the retailer name
     """
+    if retailer.isascii():
+        return len(retailer.translate(_STRIP_NON_ALNUM))
     return sum(c.isalnum() for c in retailer)
 
 
@@ -30,12 +37,13 @@ def _get_total_amount_points(total: str) -> int:
     Returns:
         Points awarded for round dollar amounts and multiples of 0.25
     """
-    points = 0
-    total_float = float(total)
+    # The validator guarantees the form \d+\.\d{2}, so work in integer
+    # cents and avoid float modulo's representation hazards.
+    dot = total.index(".")
+    cents = int(total[:dot]) * 100 + int(total[dot + 1 : dot + 3])
 
-    if total_float.is_integer():
-        points += 50
-    if total_float % 0.25 == 0:
+    points = 50 if cents % 100 == 0 else 0
+    if cents % 25 == 0:
         points += 25
     return points
 
@@ -73,7 +81,11 @@ def _get_description_length_points(items: List[Dict[str, str]]) -> int:
     for item in items:
         description = item["shortDescription"].strip()
         if len(description) % 3 == 0:
-            points += int(float(item["price"]) * 0.2 + 0.99)
+            # ceil(price * 0.2) in integer cents: ceil(cents / 500)
+            price = item["price"]
+            dot = price.index(".")
+            cents = int(price[:dot]) * 100 + int(price[dot + 1 : dot + 3])
+            points += -(-cents // 500)
     return points
 
 
@@ -89,8 +101,9 @@ def _get_purchase_date_points(purchase_date: str) -> int:
     Returns:
         Points awarded for odd numbered days
     """
-    date = datetime.strptime(purchase_date, "%Y-%m-%d")
-    return 6 if date.day % 2 == 1 else 0
+    # Assemble the day from ordinals; no substring allocation.
+    day = (ord(purchase_date[8]) - 48) * 10 + (ord(purchase_date[9]) - 48)
+    return 6 * (day & 1)
 
 
 def _get_purchase_time_points(purchase_time: str) -> int:
@@ -105,8 +118,8 @@ def _get_purchase_time_points(purchase_time: str) -> int:
     Returns:
         Points awarded for purchases between 2:00pm and 4:00pm
     """
-    time = datetime.strptime(purchase_time, "%H:%M")
-    return 10 if 14 <= time.hour < 16 else 0
+    hour = (ord(purchase_time[0]) - 48) * 10 + (ord(purchase_time[1]) - 48)
+    return 10 if 14 <= hour < 16 else 0
 
 
 def calculate_points(receipt: Dict[str, Union[str, List[Dict[str, str]]]]) -> int:
@@ -147,12 +160,63 @@ def calculate_points(receipt: Dict[str, Union[str, List[Dict[str, str]]]]) -> in
         >>> calculate_points(receipt)
         14
     """
-    points = 0
-    points += _get_retailer_name_points(receipt["retailer"])
-    points += _get_total_amount_points(receipt["total"])
-    points += _get_items_count_points(receipt["items"])
-    points += _get_description_length_points(receipt["items"])
-    points += _get_purchase_date_points(receipt["purchaseDate"])
-    points += _get_purchase_time_points(receipt["purchaseTime"])
+    retailer = receipt["retailer"]
+    total = receipt["total"]
+    items = receipt["items"]
+    purchase_date = receipt["purchaseDate"]
+    purchase_time = receipt["purchaseTime"]
+
+    # Rule 1
+    points = _get_retailer_name_points(retailer)
+
+    # Rules 2 & 3: integer cents sidestep float modulo entirely
+    dot = total.index(".")
+    total_cents = int(total[:dot]) * 100 + int(total[dot + 1 : dot + 3])
+    if total_cents % 100 == 0:
+        points += 50
+    if total_cents % 25 == 0:
+        points += 25
+
+    # Rule 4
+    points += (len(items) // 2) * 5
+
+    # Rule 5: single pass over the items list, ceiling in integer cents
+    for item in items:
+        description = item["shortDescription"].strip()
+        if len(description) % 3 == 0:
+            price = item["price"]
+            dot = price.index(".")
+            cents = int(price[:dot]) * 100 + int(price[dot + 1 : dot + 3])
+            points += -(-cents // 500)
+
+    # Rule 6: day assembled from ordinals; branchless odd check
+    day = (ord(purchase_date[8]) - 48) * 10 + (ord(purchase_date[9]) - 48)
+    points += 6 * (day & 1)
+
+    # Rule 7
+    hour = (ord(purchase_time[0]) - 48) * 10 + (ord(purchase_time[1]) - 48)
+    if 14 <= hour < 16:
+        points += 10
 
     return points
+
+
+def calculate_points_batch(
+    receipts: List[Dict[str, Union[str, List[Dict[str, str]]]]]
+) -> List[int]:
+    """Calculate points for many receipts in one call.
+
+    Bulk callers (backfills, server-side recalculation) should prefer this
+    over looping calculate_points themselves: the function reference is
+    bound once outside the loop, and the result list is built in a single
+    comprehension.
+
+    Args:
+        receipts: List of receipt dictionaries in the same format
+                 accepted by calculate_points
+
+    Returns:
+        Point totals, one per receipt, in input order
+    """
+    calc = calculate_points
+    return [calc(receipt) for receipt in receipts]
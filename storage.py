@@ -0,0 +1,77 @@
+from array import array
+from threading import Lock
+from typing import Dict, List, Optional
+
+
+class ReceiptStore:
+    """Sharded, bounded store mapping receipt ids to point totals.
+
+    The layout is structure-of-arrays: each shard keeps one contiguous
+    array('l') column of point totals plus a dict mapping id to row index,
+    instead of scattering per-entry Python ints across a dict. The column
+    stays cache-friendly for whole-store scans and leaves room for more
+    columns (day, hour, total cents) if richer queries are ever needed.
+
+    Each shard has its own lock, so concurrent handlers only contend when
+    ids hash to the same shard. Capacity is bounded: a full shard evicts
+    its oldest id (dicts keep insertion order) and reuses that row, so the
+    arrays never grow past their per-shard cap.
+
+    Note this is still per-process storage; a multi-worker deployment that
+    needs a shared view should put an external store (e.g. Redis) behind
+    the same store/lookup interface.
+    """
+
+    def __init__(self, shards: int = 16, max_receipts: int = 100_000) -> None:
+        """Create a store with the given shard count and capacity.
+
+        Args:
+            shards: Number of shards; must be a power of two
+            max_receipts: Total id capacity across all shards; must be at
+                least the shard count so every shard can hold an entry
+        """
+        if shards & (shards - 1):
+            raise ValueError("shards must be a power of two")
+        if max_receipts < shards:
+            raise ValueError("max_receipts must be at least the shard count")
+        self._mask = shards - 1
+        self._max_per_shard = max_receipts // shards
+        self._rows: List[Dict[str, int]] = [{} for _ in range(shards)]
+        self._points: List[array] = [array("l") for _ in range(shards)]
+        self._locks: List[Lock] = [Lock() for _ in range(shards)]
+
+    def store(self, receipt_id: str, points: int) -> None:
+        """Store a receipt's point total under its shard lock.
+
+        Storing an id that already exists overwrites its row in place.
+        When the shard is at capacity, the oldest id is evicted and its
+        row is reused for the new entry.
+        """
+        shard = hash(receipt_id) & self._mask
+        with self._locks[shard]:
+            rows = self._rows[shard]
+            column = self._points[shard]
+            row = rows.get(receipt_id)
+            if row is not None:
+                column[row] = points
+                return
+            if len(rows) >= self._max_per_shard:
+                row = rows.pop(next(iter(rows)))
+                column[row] = points
+            else:
+                row = len(column)
+                column.append(points)
+            rows[receipt_id] = row
+
+    def lookup(self, receipt_id: str) -> Optional[int]:
+        """Return the stored point total for a receipt id, or None if absent."""
+        shard = hash(receipt_id) & self._mask
+        with self._locks[shard]:
+            row = self._rows[shard].get(receipt_id)
+            if row is None:
+                return None
+            return self._points[shard][row]
+
+    def __len__(self) -> int:
+        """Return the number of receipts currently stored."""
+        return sum(len(rows) for rows in self._rows)
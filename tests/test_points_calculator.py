@@ -137,6 +137,29 @@ def test_item_description_points():
         assert points == expected_points  # Test just the description logic
 
 
+def test_item_description_ceiling_boundaries():
+    # Rule 5 takes the true ceiling of price * 0.2, computed in integer
+    # cents. Prices just above a multiple of $5.00 round up to the next
+    # point; the old float formula (int(price * 0.2 + 0.99)) did not.
+    test_cases = [
+        ("10.00", 2),  # Exact multiple: 2.0 -> 2
+        ("55.01", 12),  # 11.002 -> ceiling 12 (float formula gave 11)
+        ("0.01", 1),  # 0.002 -> ceiling 1 (float formula gave 0)
+        ("24.99", 5),  # 4.998 -> ceiling 5
+        ("25.00", 5),  # Exact multiple: 5.0 -> 5
+    ]
+
+    for price, expected_points in test_cases:
+        receipt = {
+            "items": [{"shortDescription": "ABC", "price": price}],  # Length 3
+            "retailer": "",  # Empty retailer
+            "total": "0.99",  # Non-round, non-quarter
+            "purchaseDate": "2024-03-20",  # Even day
+            "purchaseTime": "13:00",  # Outside range
+        }
+        assert calculate_points(receipt) == expected_points
+
+
 def test_odd_day_points():
     test_cases = [
         ("2024-03-21", 6),  # Odd day
@@ -0,0 +1,81 @@
+import pytest
+from storage import ReceiptStore
+
+
+def test_store_lookup_roundtrip():
+    store = ReceiptStore()
+    test_cases = [
+        ("a7e8f9b1c2d34e5f8a7b8c9d0e1f2a3b", 28),
+        ("id-with-zero-points", 0),
+        ("another-id", 109),
+    ]
+
+    for receipt_id, points in test_cases:
+        store.store(receipt_id, points)
+
+    for receipt_id, points in test_cases:
+        assert store.lookup(receipt_id) == points
+
+
+def test_lookup_missing_id_returns_none():
+    store = ReceiptStore()
+    assert store.lookup("never-stored") is None
+
+    store.store("stored", 5)
+    assert store.lookup("still-missing") is None
+
+
+def test_store_overwrites_existing_id():
+    store = ReceiptStore()
+    store.store("id", 10)
+    store.store("id", 20)
+    assert store.lookup("id") == 20
+    assert len(store) == 1
+
+
+def test_overwrite_reuses_row_and_evicts_nothing():
+    store = ReceiptStore(shards=1, max_receipts=3)
+    for _ in range(10):
+        store.store("id", 1)
+    assert len(store._points[0]) == 1  # Column must not grow on overwrite
+
+    # Overwriting in a full shard must not evict an unrelated id.
+    store.store("id1", 1)
+    store.store("id2", 2)
+    store.store("id", 99)
+    assert len(store) == 3
+    assert store.lookup("id") == 99
+    assert store.lookup("id1") == 1
+    assert store.lookup("id2") == 2
+    assert len(store._points[0]) == 3
+
+
+def test_eviction_at_capacity():
+    # One shard so insertion order is global: filling past capacity must
+    # evict the oldest ids and keep the newest.
+    store = ReceiptStore(shards=1, max_receipts=3)
+    for i in range(5):
+        store.store(f"id{i}", i)
+
+    assert len(store) == 3
+    assert store.lookup("id0") is None  # Oldest, evicted
+    assert store.lookup("id1") is None  # Second oldest, evicted
+    assert store.lookup("id2") == 2
+    assert store.lookup("id3") == 3
+    assert store.lookup("id4") == 4  # Newest survives
+
+
+def test_len_counts_all_shards():
+    store = ReceiptStore(shards=4, max_receipts=100)
+    assert len(store) == 0
+
+    for i in range(10):
+        store.store(f"id{i}", i)
+    assert len(store) == 10
+
+
+def test_invalid_construction():
+    with pytest.raises(ValueError):
+        ReceiptStore(shards=3)  # Not a power of two
+    with pytest.raises(ValueError):
+        ReceiptStore(shards=16, max_receipts=8)  # Less than one per shard
@@ -0,0 +1,65 @@
+import pytest
+from validators import _validate_purchase_date, _validate_purchase_time
+
+
+def test_valid_purchase_dates():
+    test_cases = [
+        "2022-01-01",  # Ordinary date
+        "2022-12-31",  # Last day of year
+        "2000-02-29",  # Leap day: divisible by 400
+        "2024-02-29",  # Leap day: divisible by 4, not by 100
+        "0001-01-01",  # Smallest valid year
+    ]
+
+    for date_str in test_cases:
+        _validate_purchase_date(date_str)  # Must not raise
+
+
+def test_invalid_purchase_dates():
+    test_cases = [
+        "2022-13-01",  # Month out of range
+        "2022-00-01",  # Month zero
+        "2022-01-32",  # Day out of range
+        "2022-01-00",  # Day zero
+        "2021-02-29",  # Not a leap year
+        "2100-02-29",  # Divisible by 100 but not 400: not a leap year
+        "2022-04-31",  # April has 30 days
+        "0000-06-30",  # Year zero
+        "2022-1-01",  # Short month form
+        "2022-01-1",  # Short day form
+        "2022/01/01",  # Wrong separators
+        "2022-0:-01",  # Non-digit characters
+        "",  # Empty
+        None,  # Not a string
+    ]
+
+    for date_str in test_cases:
+        with pytest.raises(ValueError):
+            _validate_purchase_date(date_str)
+
+
+def test_valid_purchase_times():
+    test_cases = [
+        "00:00",  # Midnight
+        "09:30",  # Morning
+        "23:59",  # End of day
+    ]
+
+    for time_str in test_cases:
+        _validate_purchase_time(time_str)  # Must not raise
+
+
+def test_invalid_purchase_times():
+    test_cases = [
+        "24:00",  # Hour out of range
+        "14:60",  # Minute out of range
+        "9:30",  # Short hour form
+        "14-00",  # Wrong separator
+        "1a:00",  # Non-digit characters
+        "",  # Empty
+        None,  # Not a string
+    ]
+
+    for time_str in test_cases:
+        with pytest.raises(ValueError):
+            _validate_purchase_time(time_str)
@@ -1,7 +1,59 @@
-from datetime import datetime
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union, cast
 import re
 
+# Validation patterns compiled once at import so the per-request hot path
+# skips re's pattern-cache lookup. \Z (unlike $) refuses a trailing newline.
+_RETAILER_RE = re.compile(r"^[\w\s\-&]+\Z")
+_DESC_RE = re.compile(r"^[\w\s\-]+\Z")
+_PRICE_RE = re.compile(r"^\d+\.\d{2}\Z")
+
+# ASCII fast path: for short strings the regex engine's per-match setup
+# dominates, so the common case checks bytes against a whitelist instead.
+# bytes.translate deletes every allowed byte; anything left is invalid.
+# The sets mirror [\w\s\-&] and [\w\s\-] exactly for ASCII: str.isspace
+# covers the same ASCII characters as \s, including \x1c-\x1f. Non-ASCII
+# input falls back to the regexes, which match Unicode word characters.
+_RETAILER_ALLOWED = bytes(
+    i for i in range(128) if chr(i).isalnum() or chr(i).isspace() or chr(i) in "_-&"
+)
+_DESC_ALLOWED = bytes(
+    i for i in range(128) if chr(i).isalnum() or chr(i).isspace() or chr(i) in "_-"
+)
+
+# Required receipt fields: the tuple preserves error-message order, the
+# frozenset makes the common all-present check a single set difference.
+_REQUIRED_FIELDS = ("retailer", "purchaseDate", "purchaseTime", "items", "total")
+_REQUIRED_SET = frozenset(_REQUIRED_FIELDS)
+
+# Days per month (index 1-12); February is adjusted for leap years inline.
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _parse2(s: str, i: int) -> int:
+    """Parse two ASCII digits of s starting at index i.
+
+    Assembles the value from character ordinals instead of slicing, so no
+    substring is allocated. Returns -1 if either character is not a digit;
+    callers' range checks reject that naturally.
+    """
+    a = ord(s[i]) - 48
+    b = ord(s[i + 1]) - 48
+    if 0 <= a <= 9 and 0 <= b <= 9:
+        return a * 10 + b
+    return -1
+
+
+def _parse4(s: str, i: int) -> int:
+    """Parse four ASCII digits of s starting at index i, or -1 if invalid.
+
+    Allocation-free companion to _parse2 for year fields.
+    """
+    high = _parse2(s, i)
+    low = _parse2(s, i + 2)
+    if high < 0 or low < 0:
+        return -1
+    return high * 100 + low
+
 
 def _validate_required_fields(
     receipt: Dict[str, Union[str, List[Dict[str, str]]]]
@@ -21,10 +73,13 @@ def _validate_required_fields(
         >>> _validate_required_fields(receipt)
         ValueError: Missing required field: purchaseDate
     """
-    required_fields = ["retailer", "purchaseDate", "purchaseTime", "items", "total"]
-    for field in required_fields:
-        if field not in receipt:
-            raise ValueError(f"Missing required field: {field}")
+    if not isinstance(receipt, dict):
+        raise ValueError("Receipt must be a JSON object")
+    if _REQUIRED_SET - receipt.keys():
+        # Report the first missing field in canonical order.
+        for field in _REQUIRED_FIELDS:
+            if field not in receipt:
+                raise ValueError(f"Missing required field: {field}")
 
 
 def _validate_retailer(retailer: str) -> None:
@@ -44,7 +99,10 @@ def _validate_retailer(retailer: str) -> None:
         >>> _validate_retailer("Target!")  # Invalid - contains !
         ValueError: Invalid retailer name format
     """
-    if not re.match(r"^[\w\s\-&]+$", retailer):
+    if retailer.isascii():
+        if not retailer or retailer.encode("ascii").translate(None, _RETAILER_ALLOWED):
+            raise ValueError("Invalid retailer name format")
+    elif not _RETAILER_RE.match(retailer):
         raise ValueError("Invalid retailer name format")
 
 
@@ -64,9 +122,26 @@ def _validate_purchase_date(date_str: str) -> None:
         >>> _validate_purchase_date("2022-13-01")  # Invalid month
         ValueError: Invalid purchase date format
     """
-    try:
-        datetime.strptime(date_str, "%Y-%m-%d")
-    except ValueError:
+    if (
+        not isinstance(date_str, str)
+        or len(date_str) != 10
+        or date_str[4] != "-"
+        or date_str[7] != "-"
+    ):
+        raise ValueError("Invalid purchase date format")
+
+    year = _parse4(date_str, 0)
+    month = _parse2(date_str, 5)
+    day = _parse2(date_str, 8)
+
+    if year < 1:
+        raise ValueError("Invalid purchase date format")
+    if not 1 <= month <= 12:
+        raise ValueError("Invalid purchase date format")
+    days_in_month = _DAYS_IN_MONTH[month]
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        days_in_month = 29
+    if not 1 <= day <= days_in_month:
         raise ValueError("Invalid purchase date format")
 
 
@@ -86,71 +161,87 @@ def _validate_purchase_time(time_str: str) -> None:
         >>> _validate_purchase_time("25:00")  # Invalid hour
         ValueError: Invalid purchase time format
     """
-    try:
-        datetime.strptime(time_str, "%H:%M")
-    except ValueError:
+    if not isinstance(time_str, str) or len(time_str) != 5 or time_str[2] != ":":
         raise ValueError("Invalid purchase time format")
 
+    hour = _parse2(time_str, 0)
+    minute = _parse2(time_str, 3)
+
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        raise ValueError("Invalid purchase time format")
 
-def _validate_item_format(item: Dict[str, str]) -> None:
+
+def _validate_item_format(item: Dict[str, str]) -> Tuple[str, str]:
     """Validate the format of a single item.
 
     Each item must be a dictionary with 'shortDescription' and 'price' keys.
     Description must contain only alphanumeric characters, spaces, and hyphens.
     Price must be in format XX.XX (dollars.cents).
 
+    Both fields are fetched once with .get() and returned so callers can
+    reuse them without re-indexing the dict.
+
     Args:
         item: The item dictionary to validate
 
+    Returns:
+        Tuple[str, str]: The validated (shortDescription, price) pair
+
     Raises:
         ValueError: If item format is invalid
 
     Example:
         >>> item = {"shortDescription": "Mountain Dew 12PK", "price": "6.49"}  # Valid
         >>> _validate_item_format(item)
+        ('Mountain Dew 12PK', '6.49')
     """
     if not isinstance(item, dict):
         raise ValueError("Each item must be an object")
-    if "shortDescription" not in item or "price" not in item:
+    description = item.get("shortDescription")
+    price = item.get("price")
+    if description is None or price is None:
         raise ValueError("Items must have shortDescription and price")
-    if not re.match(r"^[\w\s\-]+$", item["shortDescription"]):
+    if description.isascii():
+        if not description or description.encode("ascii").translate(None, _DESC_ALLOWED):
+            raise ValueError("Invalid item description format")
+    elif not _DESC_RE.match(description):
         raise ValueError("Invalid item description format")
-    if not re.match(r"^\d+\.\d{2}$", item["price"]):
+    if not _PRICE_RE.match(price):
         raise ValueError("Invalid item price format")
+    return description, price
 
 
-def _validate_item_price(price_str: str, description: str) -> float:
-    """Validate and convert an item's price.
+def _validate_item_price(price_str: str, description: str) -> int:
+    """Validate and convert an item's price to integer cents.
 
-    Price must be a positive number.
+    Price must be in dollars.cents form; parsing in cents keeps the whole
+    pipeline in exact integer arithmetic.
 
     Args:
         price_str: The price string to validate
         description: The item description (for error messages)
 
     Returns:
-        float: The validated price value
+        int: The validated price in cents
 
     Raises:
-        ValueError: If price is invalid or negative
+        ValueError: If price is invalid
 
     Example:
         >>> _validate_item_price("10.99", "Sample Item")  # Valid
-        10.99
-        >>> _validate_item_price("-1.00", "Sample Item")  # Invalid
-        ValueError: Item price cannot be negative
+        1099
+        >>> _validate_item_price("abc", "Sample Item")  # Invalid
+        ValueError: Invalid price value for item: Sample Item
     """
     try:
-        price = float(price_str)
-        if price < 0:
-            raise ValueError("Item price cannot be negative")
-        return price
+        dot = price_str.index(".")
+        return int(price_str[:dot]) * 100 + int(price_str[dot + 1 : dot + 3])
     except ValueError:
         raise ValueError(f"Invalid price value for item: {description}")
 
 
-def _validate_items_array(items: List[Dict[str, str]]) -> float:
-    """Validate the array of items and calculate their total sum.
+def _validate_items_array(items: List[Dict[str, str]]) -> int:
+    """Validate the array of items and calculate their total sum in cents.
 
     Must be a non-empty list of valid items.
 
@@ -158,7 +249,7 @@ def _validate_items_array(items: List[Dict[str, str]]) -> float:
         items: List of item dictionaries to validate
 
     Returns:
-        float: Sum of all item prices
+        int: Sum of all item prices in cents
 
     Raises:
         ValueError: If items array is invalid or empty
@@ -169,52 +260,48 @@ def _validate_items_array(items: List[Dict[str, str]]) -> float:
         ...     {"shortDescription": "Item 2", "price": "5.00"}
         ... ]
         >>> _validate_items_array(items)
-        15.00
+        1500
     """
     if not isinstance(items, list) or len(items) < 1:
         raise ValueError("Items must be a non-empty array")
 
     total_sum = 0
     for item in items:
-        _validate_item_format(item)
-        total_sum += _validate_item_price(item["price"], item["shortDescription"])
+        description, price = _validate_item_format(item)
+        total_sum += _validate_item_price(price, description)
     return total_sum
 
 
-def _validate_total(total_str: str, items_sum: float) -> None:
+def _validate_total(total_str: str, items_sum_cents: int) -> None:
     """Validate the receipt total.
 
-    Total must be in format XX.XX, be positive, and match the sum of item prices.
-    A small difference (≤ $0.01) is allowed to account for rounding.
+    Total must be in format XX.XX and match the sum of item prices.
+    A difference of at most one cent is allowed to account for rounding.
+    Comparing in integer cents makes the check exact.
 
     Args:
         total_str: The total amount string to validate
-        items_sum: The calculated sum of all items
+        items_sum_cents: The calculated sum of all items in cents
 
     Raises:
         ValueError: If total format is invalid or doesn't match items sum
 
     Example:
-        >>> _validate_total("15.00", 15.00)  # Valid
-        >>> _validate_total("15.00", 14.00)  # Invalid - doesn't match
-        ValueError: Receipt total (15.0) does not match sum of items (14.0)
+        >>> _validate_total("15.00", 1500)  # Valid
+        >>> _validate_total("15.00", 1400)  # Invalid - doesn't match
+        ValueError: Receipt total (15.00) does not match sum of items (14.00)
     """
-    if not re.match(r"^\d+\.\d{2}$", total_str):
+    if not _PRICE_RE.match(total_str):
         raise ValueError("Invalid total format")
 
-    try:
-        total = float(total_str)
-        if total < 0:
-            raise ValueError("Total cannot be negative")
+    dot = total_str.index(".")
+    total_cents = int(total_str[:dot]) * 100 + int(total_str[dot + 1 : dot + 3])
 
-        if abs(total - items_sum) > 0.01:
-            raise ValueError(
-                f"Receipt total ({total}) does not match sum of items ({items_sum})"
-            )
-    except ValueError as e:
-        if str(e).startswith("Receipt total"):
-            raise e
-        raise ValueError("Invalid total value")
+    if abs(total_cents - items_sum_cents) > 1:
+        raise ValueError(
+            f"Receipt total ({total_cents / 100:.2f}) does not match "
+            f"sum of items ({items_sum_cents / 100:.2f})"
+        )
 
 
 def validate_receipt(receipt: Dict[str, Union[str, List[Dict[str, str]]]]) -> bool:
@@ -251,11 +338,11 @@ def validate_receipt(receipt: Dict[str, Union[str, List[Dict[str, str]]]]) -> bo
         True
     """
     _validate_required_fields(receipt)
-    _validate_retailer(receipt["retailer"])
-    _validate_purchase_date(receipt["purchaseDate"])
-    _validate_purchase_time(receipt["purchaseTime"])
+    _validate_retailer(cast(str, receipt["retailer"]))
+    _validate_purchase_date(cast(str, receipt["purchaseDate"]))
+    _validate_purchase_time(cast(str, receipt["purchaseTime"]))
 
-    items_sum = _validate_items_array(receipt["items"])
-    _validate_total(receipt["total"], items_sum)
+    items_sum = _validate_items_array(cast(List[Dict[str, str]], receipt["items"]))
+    _validate_total(cast(str, receipt["total"]), items_sum)
 
     return True